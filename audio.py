@@ -1,10 +1,244 @@
 from tkinter import filedialog
+import atexit
+import functools
+import json
+import os
+import threading
 import pygame
 
+from concurrent.futures import ThreadPoolExecutor
+
 from mutagen.easyid3 import EasyID3
-from mutagen.mp3 import MP3
+from mutagen.id3 import ID3NoHeaderError
+from mutagen.mp3 import MP3, MPEGInfo
+
+
+# On-disk metadata cache shared by all AudioPlayer instances.
+_META_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".vibe", "metacache.json")
+_meta_cache = None
+
+
+def _load_meta_cache():
+    """
+    Load the persistent metadata cache from disk (once per process).
+
+    Returns
+    -------
+    dict
+        Mapping of "path|mtime|size" keys to [title, artist, length] entries.
+        Empty when the cache file is missing or unreadable.
+    """
+    global _meta_cache
+    if _meta_cache is None:
+        try:
+            with open(_META_CACHE_FILE, "r", encoding="utf-8") as f:
+                _meta_cache = json.load(f)
+        except Exception:
+            _meta_cache = {}
+        atexit.register(_save_meta_cache)
+    return _meta_cache
+
+
+def _save_meta_cache():
+    """
+    Write the in-memory metadata cache back to disk at shutdown.
+
+    Notes
+    -----
+    Silently gives up on any I/O error - the cache is purely an
+    optimization and will simply be rebuilt on the next run.
+    """
+    if not _meta_cache:
+        return
+    try:
+        os.makedirs(os.path.dirname(_META_CACHE_FILE), exist_ok=True)
+        with open(_META_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(_meta_cache, f)
+    except Exception:
+        pass
 
 
+# MPEG header lookup tables used by _fast_mp3_length
+_MPEG_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),   # MPEG1
+    2: (22050, 24000, 16000),   # MPEG2
+    0: (11025, 12000, 8000),    # MPEG2.5
+}
+_SAMPLES_PER_FRAME = {
+    3: {3: 384, 2: 1152, 1: 1152},  # MPEG1: layer I, II, III
+    2: {3: 384, 2: 1152, 1: 576},   # MPEG2/2.5
+    0: {3: 384, 2: 1152, 1: 576},
+}
+
+
+def _fast_mp3_length(f):
+    """
+    Read an MP3's duration straight from its Xing/Info/VBRI header.
+
+    For files written by normal encoders the total frame count sits in a
+    single field right after the first MPEG header, so the duration is
+    frames * samples_per_frame / sample_rate - no frame-by-frame scan.
+
+    Parameters
+    ----------
+    f : file object
+        Binary file object positioned anywhere (it is rewound)
+
+    Returns
+    -------
+    float or None
+        Duration in seconds, or None when no Xing/Info/VBRI header was
+        found (caller should fall back to mutagen's full parse).
+    """
+    try:
+        f.seek(0)
+        head = f.read(10)
+
+        # Skip an ID3v2 tag if present (synchsafe 28-bit size)
+        offset = 0
+        if head[:3] == b"ID3":
+            size = (
+                (head[6] & 0x7F) << 21 | (head[7] & 0x7F) << 14
+                | (head[8] & 0x7F) << 7 | (head[9] & 0x7F)
+            )
+            offset = 10 + size
+
+        f.seek(offset)
+        block = f.read(4096)
+
+        # Find the first MPEG frame sync (11 set bits)
+        sync = -1
+        for i in range(len(block) - 4):
+            if block[i] == 0xFF and (block[i + 1] & 0xE0) == 0xE0:
+                sync = i
+                break
+        if sync == -1:
+            return None
+
+        header = block[sync:sync + 4]
+        version = (header[1] >> 3) & 0x03
+        layer = (header[1] >> 1) & 0x03
+        rate_index = (header[2] >> 2) & 0x03
+        channel_mode = (header[3] >> 6) & 0x03
+        if version == 1 or layer == 0 or rate_index == 3:
+            return None
+
+        sample_rate = _MPEG_SAMPLE_RATES[version][rate_index]
+        samples_per_frame = _SAMPLES_PER_FRAME[version][layer]
+
+        # Xing/Info sits after the side info block, whose size depends on
+        # version and channel mode; VBRI is always 32 bytes in
+        if version == 3:
+            side_info = 17 if channel_mode == 3 else 32
+        else:
+            side_info = 9 if channel_mode == 3 else 17
+
+        frames = None
+        tag = block[sync + 4 + side_info:sync + 4 + side_info + 4]
+        if tag in (b"Xing", b"Info"):
+            base = sync + 4 + side_info + 4
+            flags = int.from_bytes(block[base:base + 4], "big")
+            if flags & 0x01:
+                frames = int.from_bytes(block[base + 4:base + 8], "big")
+        elif block[sync + 4 + 32:sync + 4 + 36] == b"VBRI":
+            base = sync + 4 + 32
+            frames = int.from_bytes(block[base + 14:base + 18], "big")
+
+        if not frames:
+            return None
+        return frames * samples_per_frame / sample_rate
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=8192)
+def _format_time(seconds):
+    """
+    Format a whole number of seconds as "M:SS", memoized.
+
+    Parameters
+    ----------
+    seconds : int
+        Truncated time in seconds
+
+    Returns
+    -------
+    str
+        Formatted time string (e.g., "3:45")
+
+    Notes
+    -----
+    The domain is positions within a song, so the cache (8192 entries,
+    about 2.3 hours of distinct seconds) turns the repeated per-frame
+    formatting into a dictionary hit.
+    """
+    minutes, remaining_seconds = divmod(seconds, 60)
+    return f"{minutes}:{remaining_seconds:02d}"
+
+
+@functools.lru_cache(maxsize=512)
+def _extract_meta(path, mtime, size):
+    """
+    Extract (title, artist, length) for an MP3 file, with caching.
+
+    Repeated plays of the same unchanged file skip the mutagen parse
+    entirely: an in-memory LRU sits in front of a persistent JSON cache
+    keyed by (path, mtime, size), so entries invalidate automatically
+    when the file is modified.
+
+    Parameters
+    ----------
+    path : str
+        Full file path to the MP3 file
+    mtime : float
+        os.stat() st_mtime of the file, part of the cache key
+    size : int
+        os.stat() st_size of the file, part of the cache key
+
+    Returns
+    -------
+    tuple[str, str, int]
+        Song title, artist, and duration in whole seconds
+    """
+    cache = _load_meta_cache()
+    key = f"{path}|{mtime}|{size}"
+    hit = cache.get(key)
+    if hit is not None:
+        return tuple(hit)
+
+    try:
+        # Open the file once and feed the same file object to both the
+        # tag reader and the stream-info parser, instead of letting
+        # MP3(...) scan the file twice
+        with open(path, "rb") as f:
+            try:
+                tags = EasyID3(f)
+            except ID3NoHeaderError:
+                tags = {}
+
+            # Xing/VBRI fast path first; only scan frames when absent
+            length = _fast_mp3_length(f)
+            if length is None:
+                f.seek(0)
+                length = MPEGInfo(f).length
+
+        title_list = tags.get("title")
+        artist_list = tags.get("artist")
+        title = title_list[0] if title_list else ""
+        artist = artist_list[0] if artist_list else ""
+        seconds = int(length)
+    except Exception:
+        # Unusual container/tag layout: let mutagen's full parser decide
+        audio_file = MP3(path, ID3=EasyID3)
+        title_list = audio_file.get("title")
+        artist_list = audio_file.get("artist")
+        title = title_list[0] if title_list else ""
+        artist = artist_list[0] if artist_list else ""
+        seconds = int(audio_file.info.length)
+
+    cache[key] = [title, artist, seconds]
+    return (title, artist, seconds)
+
 
 class AudioPlayer:
     """
@@ -30,6 +264,9 @@ class AudioPlayer:
         List of file paths to MP3 files in the playlist
     index : int
         Current position in the playlist (0-indexed)
+    current_path : str or None
+        File path at the current index, kept in sync by _set_index so
+        hot paths avoid re-indexing the playlist
     is_playing : bool
         True if music is currently playing
     paused : bool
@@ -50,8 +287,9 @@ class AudioPlayer:
         Position in seconds where seeking/playback started
     last_update_time : int
         Pygame ticks timestamp of last position update
-    AUDIO_OK : bool
-        True if pygame.mixer initialized successfully
+    AUDIO_OK : bool or None
+        True if pygame.mixer initialized successfully, False if it
+        failed, None while initialization is still deferred
     
     Examples
     --------
@@ -61,6 +299,19 @@ class AudioPlayer:
     >>> audio.toggle_play_pause()  # Starts playback
     """
 
+    # Attributes like is_playing/seek_offset/song_length are read every
+    # frame; slots keep that access off the instance __dict__
+    __slots__ = (
+        'player_window', 'root', 'pause_bnt', 'play_bnt', 'current_icon',
+        'playlist', 'index', 'current_path', '_next', '_prev',
+        'is_playing', 'paused', 'loop_mode',
+        'current_song_title', 'current_song_artist',
+        'current_song_length', 'current_song_position', 'song_length',
+        'seek_offset', 'last_update_time', '_play_pos_ms', '_last_pos_sec',
+        '_pos_strings', '_meta_by_key', '_pending_seek', '_last_seek_ticks',
+        '_pending_playlist', '_prefetch_pool', '_prefetch_future', 'AUDIO_OK',
+    )
+
     def __init__(self, player_window):
         """
         Initialize the audio player with pygame mixer and default values.
@@ -72,17 +323,12 @@ class AudioPlayer:
             
         Notes
         -----
-        Automatically initializes pygame.mixer and sets up the music end event.
-        If mixer initialization fails, AUDIO_OK is set to False and audio
-        operations will be disabled.
+        pygame.mixer initialization is deferred until the first audio
+        operation (see _ensure_mixer), so simply opening the app never
+        spins up the mixer. If initialization fails, AUDIO_OK is set to
+        False and audio operations are disabled.
         """
-        try:
-            pygame.mixer.init()
-            self.AUDIO_OK = True
-            pygame.mixer.music.set_endevent(pygame.USEREVENT + 1) 
-        except Exception as e:
-            self.AUDIO_OK = False
-            print(f"Error initializing mixer: {e}")
+        self.AUDIO_OK = None
 
         self.player_window = player_window 
         self.root = player_window.root
@@ -92,6 +338,11 @@ class AudioPlayer:
 
         self.playlist = []
         self.index = 0
+        self.current_path = None
+
+        # Precomputed wrap-around index maps (see _rebuild_index_maps)
+        self._next = []
+        self._prev = []
         self.is_playing = False
         self.paused = False
 
@@ -109,7 +360,107 @@ class AudioPlayer:
         self.seek_offset = 0
         self.last_update_time = 0
 
-          
+        # Backend counter reading (music.get_pos) at the last seek/play,
+        # used to rebase the counter onto seek_offset
+        self._play_pos_ms = 0
+
+        # Last whole second pushed to the UI; -1 forces a refresh
+        self._last_pos_sec = -1
+
+        # Precomputed "M:SS" strings for every second of the current song
+        self._pos_strings = None
+
+        # Metadata keyed by (path, mtime, size): a stat call is enough to
+        # serve repeat plays without touching mutagen at all
+        self._meta_by_key = {}
+
+        # Seek throttling: position waiting to be applied and the ticks
+        # reading of the last seek that reached the mixer; the frame
+        # loop flushes the pending value once the ~16 ms window passes
+        self._pending_seek = None
+        self._last_seek_ticks = -1000
+
+        # Playlist handed back by the ingest worker, picked up by
+        # poll_ingest on the frame loop (None when nothing is pending)
+        self._pending_playlist = None
+
+        # Single-worker pool that warms up the next playlist entry while
+        # the current one plays; at most one prefetch is in flight.
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._prefetch_future = None
+
+    def _ensure_mixer(self):
+        """
+        Initialize pygame.mixer on first use and memoize the result.
+
+        Returns
+        -------
+        bool
+            True if the mixer is (now) initialized, False if it failed
+
+        Notes
+        -----
+        Called at the top of every audio operation. The first call does
+        pygame.mixer.init(); later calls just return the cached AUDIO_OK
+        flag. End-of-song is detected with check_song_end() rather than
+        a mixer end event, so no event registration happens here.
+        """
+        if self.AUDIO_OK is None:
+            try:
+                pygame.mixer.init()
+                self.AUDIO_OK = True
+            except Exception as e:
+                self.AUDIO_OK = False
+                print(f"Error initializing mixer: {e}")
+        return self.AUDIO_OK
+
+    def _prefetch_next(self):
+        """
+        Kick off metadata extraction for the next playlist entry.
+
+        Submits a background job that parses the next track's metadata
+        (populating the _extract_meta cache) and reads its first 64 KB
+        to warm the OS page cache, so skipping ahead doesn't stall on
+        disk I/O or ID3 parsing.
+
+        Notes
+        -----
+        - Does nothing for playlists with fewer than two entries
+        - Keeps at most one prefetch in flight at a time
+        """
+        if len(self.playlist) < 2:
+            return
+        if self._prefetch_future is not None and not self._prefetch_future.done():
+            return
+
+        next_path = self.playlist[(self.index + 1) % len(self.playlist)]
+        self._prefetch_future = self._prefetch_pool.submit(
+            self._prefetch_worker, next_path
+        )
+
+    @staticmethod
+    def _prefetch_worker(path):
+        """
+        Background job: parse metadata and warm the page cache for a file.
+
+        Parameters
+        ----------
+        path : str
+            Full file path to the MP3 file to prefetch
+
+        Notes
+        -----
+        Any error (missing file, corrupt tags) is swallowed - prefetching
+        is purely opportunistic.
+        """
+        try:
+            st = os.stat(path)
+            _extract_meta(path, st.st_mtime, st.st_size)
+            with open(path, "rb") as f:
+                f.read(65536)
+        except Exception:
+            pass
+
     def _play_music(self, song):
         """
         Load and play a song file.
@@ -126,16 +477,19 @@ class AudioPlayer:
         -----
         - Resets seek_offset and last_update_time for accurate position tracking
         - Automatically calls _song_meta_data() to extract song information
-        - Only executes if AUDIO_OK is True
+        - Initializes the mixer on first use; does nothing if that fails
         """
-        if self.AUDIO_OK:
+        if self._ensure_mixer():
             pygame.mixer.music.load(song)
             pygame.mixer.music.play()
             self.is_playing = True
             self.paused = False
             self.seek_offset = 0
             self.last_update_time = pygame.time.get_ticks()
+            self._play_pos_ms = 0
+            self._last_pos_sec = -1
             self._song_meta_data()
+            self._prefetch_next()
 
     def _pause_music(self):
         """
@@ -177,6 +531,10 @@ class AudioPlayer:
         if not self.playlist:
             return
 
+        # Sync current_path if the playlist was assigned directly
+        if self.current_path is None:
+            self._set_index(self.index)
+
         if self.is_playing:
             # Pause
             try:
@@ -189,12 +547,12 @@ class AudioPlayer:
             # If music was never started, start it; otherwise unpause
             try:
                 if not self.paused:
-                    self._play_music(self.playlist[self.index])
+                    self._play_music(self.current_path)
                 else:
                     pygame.mixer.music.unpause()
                     self.paused = False
             except Exception:
-                self._play_music(self.playlist[self.index])
+                self._play_music(self.current_path)
 
             self.is_playing = True
             self.current_icon = self.pause_bnt
@@ -210,9 +568,10 @@ class AudioPlayer:
         Notes
         -----
         - Replaces entire playlist (does not append)
-        - Automatically starts playing first track
+        - Ingestion (stat + metadata warm-up) runs on a worker thread so
+          the UI never freezes on large selections; the frame loop picks
+          the result up via poll_ingest once the worker finishes
         - Updates UI to show pause button
-        - Prints loaded playlist to console
         """
         files = filedialog.askopenfilenames(
             parent=self.root,
@@ -221,10 +580,111 @@ class AudioPlayer:
         )
 
         if files:
-            self.playlist = list(files)
-            self._play_music(self.playlist[self.index])
-            self.is_playing = True
-            self.current_icon = self.pause_bnt
+            threading.Thread(
+                target=self._ingest_playlist,
+                args=(list(files),),
+                daemon=True,
+            ).start()
+
+    def _ingest_playlist(self, files):
+        """
+        Worker: pre-stat and cache metadata for a new playlist.
+
+        Parameters
+        ----------
+        files : list[str]
+            File paths selected in the dialog
+
+        Notes
+        -----
+        Populates _meta_by_key for every readable file, then publishes
+        the list through _pending_playlist. A single attribute write is
+        atomic under the GIL, and the frame loop (poll_ingest) performs
+        the playlist swap and playback start on the UI side - the app
+        never services Tk timers, so root.after is not an option here.
+        """
+        for path in files:
+            try:
+                st = os.stat(path)
+                key = (path, st.st_mtime, st.st_size)
+                if key not in self._meta_by_key:
+                    self._meta_by_key[key] = _extract_meta(
+                        path, st.st_mtime, st.st_size
+                    )
+            except Exception:
+                continue
+
+        self._pending_playlist = files
+
+    def poll_ingest(self):
+        """
+        Pick up a playlist published by the ingest worker, if any.
+
+        Notes
+        -----
+        Called once per frame from the main loop. When the worker has
+        finished, installs the new playlist and starts playback; all
+        state mutation happens here on the UI thread, the worker only
+        publishes the finished list.
+        """
+        files = self._pending_playlist
+        if files is not None:
+            self._pending_playlist = None
+            self._start_playback(files)
+
+    def _start_playback(self, files):
+        """
+        Install a freshly ingested playlist and start playing.
+
+        Parameters
+        ----------
+        files : list[str]
+            File paths that make up the new playlist
+
+        Notes
+        -----
+        Runs on the UI thread (called from poll_ingest).
+        """
+        self.playlist = files
+        self._rebuild_index_maps()
+        self._set_index(0)
+        self._play_music(self.current_path)
+        self.is_playing = True
+        self.current_icon = self.pause_bnt
+
+    def _rebuild_index_maps(self):
+        """
+        Precompute wrap-around successor/predecessor index arrays.
+
+        Builds self._next and self._prev so that track navigation is a
+        plain list index instead of a modulo over len(playlist) - the
+        modulo otherwise runs on every track boundary under Loop All.
+
+        Notes
+        -----
+        Called whenever the playlist changes; next_song/previous_song
+        rebuild lazily if the playlist was assigned directly.
+        """
+        n = len(self.playlist)
+        self._next = [(i + 1) % n for i in range(n)]
+        self._prev = [(i - 1) % n for i in range(n)]
+
+    def _set_index(self, i):
+        """
+        Move to a playlist position, keeping current_path in sync.
+
+        Parameters
+        ----------
+        i : int
+            New playlist index
+
+        Notes
+        -----
+        All index writes go through here so readers can use
+        self.current_path instead of re-indexing self.playlist.
+        """
+        self.index = i
+        self.current_path = self.playlist[i] if self.playlist else None
 
     def next_song(self):
         """
@@ -245,8 +705,10 @@ class AudioPlayer:
         """
         if not self.playlist:
             return
-        self.index = (self.index + 1) % len(self.playlist)
-        self._play_music(self.playlist[self.index])
+        if len(self._next) != len(self.playlist):
+            self._rebuild_index_maps()
+        self._set_index(self._next[self.index])
+        self._play_music(self.current_path)
         self.is_playing = True
         self.current_icon = self.pause_bnt
 
@@ -269,8 +731,10 @@ class AudioPlayer:
         """
         if not self.playlist:
             return
-        self.index = (self.index - 1) % len(self.playlist)
-        self._play_music(self.playlist[self.index])
+        if len(self._prev) != len(self.playlist):
+            self._rebuild_index_maps()
+        self._set_index(self._prev[self.index])
+        self._play_music(self.current_path)
         self.is_playing = True
         self.current_icon = self.pause_bnt
 
@@ -286,48 +750,79 @@ class AudioPlayer:
         Notes
         -----
         Called by the volume slider's callback function.
-        Prints volume value to console for debugging.
+        Initializes the mixer on first use.
         """
-        pygame.mixer.music.set_volume(value)
+        if self._ensure_mixer():
+            pygame.mixer.music.set_volume(value)
         
 
     def _song_meta_data(self):
         """
-        Extract and store metadata from the current song.
-        
-        Reads ID3 tags from the current MP3 file using mutagen library
-        to extract title, artist, and duration. Updates all relevant
-        instance variables with the extracted information.
-        
+        Schedule metadata extraction for the current song.
+
+        Spawns a daemon worker thread running _extract_meta_worker so the
+        ID3 parse and file I/O never sit on the audio-start critical path
+        - playback begins immediately and the UI picks up the title,
+        artist and duration once the worker publishes them.
+
+        Notes
+        -----
+        The worker is handed the current index so results from a stale
+        extraction (user skipped on before it finished) are discarded.
+        """
+        threading.Thread(
+            target=self._extract_meta_worker,
+            args=(self.current_path, self.index),
+            daemon=True,
+        ).start()
+
+    def _extract_meta_worker(self, path, index):
+        """
+        Worker: extract and publish metadata for a song.
+
+        Parameters
+        ----------
+        path : str
+            Full file path to the MP3 file
+        index : int
+            Playlist index the song had when extraction was scheduled;
+            results are dropped if the user has moved on since
+
         Notes
         -----
         - Safely handles missing metadata by using empty strings
         - Calculates and formats song duration as M:SS
         - Silently fails on any exception (corrupted files, missing tags)
-        - Updates: current_song_title, current_song_artist, 
+        - Results come from _extract_meta, so unchanged files are served
+          from the metadata cache without re-parsing the MP3
+        - Updates: current_song_title, current_song_artist,
           current_song_length, song_length
         """
-
         try:
-            audio_file = MP3(self.playlist[self.index], ID3=EasyID3)
+            st = os.stat(path)
+            key = (path, st.st_mtime, st.st_size)
+            meta = self._meta_by_key.get(key)
+            if meta is None:
+                meta = _extract_meta(path, st.st_mtime, st.st_size)
+                self._meta_by_key[key] = meta
+            title, artist, seconds = meta
+        except Exception:
+            return
 
-            title_list = audio_file.get("title")
-            artist_list = audio_file.get("artist")
-            title = title_list[0] if title_list else ""
-            artist = artist_list[0] if artist_list else ""
+        if self.index != index:
+            return
 
-            seconds = int(audio_file.info.length)
-            self.song_length = seconds
-            minutes = seconds // 60
-            remaining_seconds = seconds % 60
-            duration = f"{minutes}:{remaining_seconds:02}"
+        self.song_length = seconds
 
-            self.current_song_title = title
-            self.current_song_artist = artist
-            self.current_song_length = duration
+        # One "M:SS" string per second of the song; update_current_position
+        # then just indexes instead of formatting every tick.
+        self._pos_strings = tuple(
+            "{}:{:02d}".format(*divmod(s, 60)) for s in range(seconds + 1)
+        )
 
-        except Exception:
-            pass
+        self.current_song_title = title
+        self.current_song_artist = artist
+        self.current_song_length = self._pos_strings[seconds]
 
     def adjust_song(self, value):
         """
@@ -348,20 +843,65 @@ class AudioPlayer:
         - Updates seek_offset and last_update_time for position tracking
         - If not playing, starts playback from the seek position
         - If paused, resumes playback from the seek position
-        - Prints debug information about seek position
+        - Seeks arriving within ~16 ms of the last applied one are
+          coalesced: only the latest pending position is applied when
+          the frame loop flushes (flush_pending_seek), so a slider drag
+          issues tens of set_pos calls instead of hundreds
         """
         # Don't do anything if no song is loaded
         if not self.playlist or self.song_length == 0:
             return
-        
+
+        if not self._ensure_mixer():
+            return
+
         # Convert slider value (0-1) to song position in seconds
         position_seconds = value * self.song_length
-        
-        
+
+        # A seek just went out - remember only the latest position and
+        # let the frame loop apply it once the window passes
+        now_ticks = pygame.time.get_ticks()
+        if now_ticks - self._last_seek_ticks < 16:
+            self._pending_seek = position_seconds
+            return
+
+        self._last_seek_ticks = now_ticks
+        self._pending_seek = None
+        self._apply_seek(position_seconds)
+
+    def flush_pending_seek(self):
+        """
+        Apply a coalesced seek once the throttle window has passed.
+
+        Notes
+        -----
+        Called once per frame from the main loop (the app never runs a
+        Tk event loop, so this cannot ride on root.after). A no-op when
+        nothing is pending or the last applied seek is under 16 ms old.
+        """
+        if self._pending_seek is None:
+            return
+        now_ticks = pygame.time.get_ticks()
+        if now_ticks - self._last_seek_ticks < 16:
+            return
+        pending, self._pending_seek = self._pending_seek, None
+        self._last_seek_ticks = now_ticks
+        self._apply_seek(pending)
+
+    def _apply_seek(self, position_seconds):
+        """
+        Perform the actual mixer seek to an absolute position.
+
+        Parameters
+        ----------
+        position_seconds : float
+            Position in the current song to seek to, in seconds
+        """
         try:
             # Store the seek position
             self.seek_offset = position_seconds
             self.last_update_time = pygame.time.get_ticks()
+            self._last_pos_sec = -1
             
             # Set the position in the song
             pygame.mixer.music.set_pos(position_seconds)
@@ -374,72 +914,134 @@ class AudioPlayer:
             elif self.paused:
                 pygame.mixer.music.unpause()
                 self.paused = False
+
+            # Rebase the backend counter: play(start=...) resets it to 0
+            # while set_pos during playback leaves it running
+            self._play_pos_ms = max(self._music_pos_ms(), 0)
         except pygame.error as e:
             print(f"Error adjusting song position: {e}")
     
-    def get_current_position(self):
+    def get_current_position(self, now_ticks=None):
         """
         Get the current playback position in seconds.
-        
+
         Calculates the current position by adding the elapsed time since
         the last seek to the seek offset position. Returns the paused
         position if playback is paused.
-        
+
+        Parameters
+        ----------
+        now_ticks : int, optional
+            A pygame.time.get_ticks() reading taken once for the current
+            frame; pass it to avoid repeated SDL timer calls when several
+            consumers sample the position in the same frame
+
         Returns
         -------
         float
             Current position in seconds, capped at song_length
-            
+
         Notes
         -----
         - Returns 0 if no song is loaded
         - Returns seek_offset if paused
-        - Calculates real-time position during playback
+        - Prefers the mixer's own millisecond counter (music.get_pos),
+          rebased onto seek_offset at the last seek, over wall-clock math
+        - Falls back to get_ticks arithmetic when the counter is
+          unavailable (mixer not initialized, or a stubbed backend)
         - Never exceeds total song length
         """
         if not self.is_playing or self.paused:
             return self.seek_offset
-        
-        # Calculate position: seek_offset + time elapsed since seek
-        elapsed = (pygame.time.get_ticks() - self.last_update_time) / 1000.0
-        current_pos = self.seek_offset + elapsed
-        
-        return min(current_pos, self.song_length)
 
-    def update_current_position(self):
+        # Prefer the backend's atomic playback counter
+        pos_ms = self._music_pos_ms()
+        if pos_ms >= 0:
+            elapsed = (pos_ms - self._play_pos_ms) * 0.001
+        else:
+            # Counter unavailable: fall back to wall-clock tracking
+            if now_ticks is None:
+                now_ticks = pygame.time.get_ticks()
+            elapsed = (now_ticks - self.last_update_time) * 0.001
+
+        return min(self.seek_offset + elapsed, self.song_length)
+
+    @staticmethod
+    def _music_pos_ms():
+        """
+        Read the mixer's playback counter in milliseconds.
+
+        Returns
+        -------
+        int
+            Milliseconds the music has been playing since the last
+            play() call, or -1 when no usable reading is available
+            (mixer not initialized, stopped, or a non-integer backend).
+        """
+        try:
+            pos = pygame.mixer.music.get_pos()
+        except Exception:
+            return -1
+        return pos if isinstance(pos, int) else -1
+
+    def update_current_position(self, now_ticks=None):
         """
         Update the formatted current position string.
-        
+
         Called every frame to update the displayed current position.
         Converts the numeric position from get_current_position() into
         a formatted string (M:SS) for display in the UI.
-        
+
+        Parameters
+        ----------
+        now_ticks : int, optional
+            Frame-level pygame.time.get_ticks() reading, forwarded to
+            get_current_position
+
         Notes
         -----
         - Updates current_song_position attribute
         - Shows "0:00" if no playlist or song_length is 0
+        - Skips the string formatting entirely when the displayed whole
+          second has not changed since the last call, so the 60 Hz loop
+          only pays for it once per second
         - Should be called in the main game loop
         """
         if self.playlist and self.song_length > 0:
-            current_seconds = self.get_current_position()
-            self.current_song_position = self.convert_sec_min(current_seconds)
+            current_seconds = int(self.get_current_position(now_ticks))
+            if current_seconds == self._last_pos_sec:
+                return
+            self._last_pos_sec = current_seconds
+            if self._pos_strings is not None:
+                self.current_song_position = self._pos_strings[
+                    min(current_seconds, self.song_length)
+                ]
+            else:
+                self.current_song_position = self.convert_sec_min(current_seconds)
         else:
             self.current_song_position = "0:00"
 
-    def convert_sec_min(self, seconds):
+    @staticmethod
+    def convert_sec_min(seconds):
         """
         Convert seconds to minutes:seconds format.
-        
+
         Parameters
         ----------
         seconds : float or int
             Time duration in seconds
-            
+
         Returns
         -------
         str
             Formatted time string as "M:SS" (e.g., "3:45", "0:08", "12:30")
-            
+
+        Notes
+        -----
+        Routes through the memoized module-level _format_time helper
+        keyed on the truncated int, so repeated positions cost a
+        dictionary hit instead of a divmod + f-string.
+
         Examples
         --------
         >>> audio.convert_sec_min(0)
@@ -449,9 +1051,7 @@ class AudioPlayer:
         >>> audio.convert_sec_min(3661)
         '61:01'
         """
-        minutes = int(seconds) // 60
-        remaining_seconds = int(seconds) % 60
-        return f"{minutes}:{remaining_seconds:02}"
+        return _format_time(int(seconds))
 
     def toggle_loop_mode(self):
         """
@@ -479,12 +1079,27 @@ class AudioPlayer:
         
         return self.loop_mode
 
+    def check_song_end(self):
+        """
+        Detect end of playback and dispatch on_song_end.
+
+        Called once per frame from the main loop. A direct
+        pygame.mixer.music.get_busy() check replaces the old
+        USEREVENT-based notification: it is O(1), does not depend on the
+        event queue being pumped, and cannot lose a race against other
+        UI events.
+        """
+        if not self.is_playing or self.paused or self.AUDIO_OK is not True:
+            return
+        if not pygame.mixer.music.get_busy():
+            self.on_song_end()
+
     def on_song_end(self):
         """
         Handle the end of song event based on loop mode.
         
-        Called automatically when pygame.USEREVENT + 1 is triggered
-        (when a song finishes playing). Behavior depends on current loop_mode:
+        Called by check_song_end when a song finishes playing.
+        Behavior depends on current loop_mode:
         
         - Loop One (2): Replays the current song
         - Loop All (1): Advances to next song in playlist
@@ -494,11 +1109,11 @@ class AudioPlayer:
         -----
         - Updates UI icons appropriately for each mode
         - Resets playback state when stopping (loop off)
-        - Should be called from the event loop when music ends
+        - Dispatched once per frame by check_song_end
         """
         if self.loop_mode == 2:
             # Loop one - replay current song
-            self._play_music(self.playlist[self.index])
+            self._play_music(self.current_path)
             self.player_window.current_icon = self.pause_bnt
             self.current_icon = self.pause_bnt
         elif self.loop_mode == 1:
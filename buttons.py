@@ -1,6 +1,75 @@
 import pygame
 
 
+# Process-wide cache of loaded button surfaces, keyed by image path.
+_IMG_CACHE = {}
+
+
+def _load(img_path):
+    """
+    Load an image surface, sharing one decoded copy per path.
+
+    Parameters
+    ----------
+    img_path : str
+        Path to the image file
+
+    Returns
+    -------
+    pygame.Surface
+        The converted surface; the same object is returned for repeated
+        loads of the same path, skipping the PNG decode and conversion
+        after the first call.
+
+    Notes
+    -----
+    Images with no alpha channel and no colorkey are converted with
+    convert() - an opaque blit moves half the bytes of a per-pixel
+    alpha-blended one. Everything else keeps convert_alpha().
+    """
+    surface = _IMG_CACHE.get(img_path)
+    if surface is None:
+        img = pygame.image.load(img_path)
+        if img.get_masks()[3] == 0 and img.get_colorkey() is None:
+            surface = img.convert()
+        else:
+            surface = img.convert_alpha()
+        _IMG_CACHE[img_path] = surface
+    return surface
+
+
+def dispatch_overlay(buttons, event):
+    """
+    Update press state for a group of buttons with one hit-test.
+
+    Instead of every button comparing the event type and running its own
+    collidepoint, the group is resolved in a single C-level
+    pygame.Rect.collidelist call over all button rects.
+
+    Parameters
+    ----------
+    buttons : sequence of Buttons
+        The buttons that should react to the event
+    event : pygame.event.Event
+        The event to process
+
+    Notes
+    -----
+    - Mouse events other than MOUSEBUTTONDOWN/MOUSEBUTTONUP are ignored
+    - On MOUSEBUTTONDOWN, only the hit button (if any) is pressed
+    - On MOUSEBUTTONUP, all buttons are released, matching the behavior
+      of Buttons.handle_overlay
+    """
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        point = pygame.Rect(event.pos, (1, 1))
+        index = point.collidelist([button.rect for button in buttons])
+        if index != -1:
+            buttons[index].is_down = True
+
+    elif event.type == pygame.MOUSEBUTTONUP:
+        for button in buttons:
+            button.is_down = False
+
 
 class Buttons:
     """
@@ -13,6 +82,8 @@ class Buttons:
     ----------
     img : pygame.Surface
         The button's image
+    img_pressed : pygame.Surface
+        Pre-composited copy of the image with the dark overlay applied
     rect : pygame.Rect
         Button's position and collision rectangle
     is_down : bool
@@ -30,27 +101,35 @@ class Buttons:
     ...     start_music()
     """
 
-    def __init__(self, x_pos, y_pos, img_path):
+    # Many button instances, few attributes: slots halve the per-button
+    # footprint and speed up the per-frame attribute reads
+    __slots__ = ('img', 'img_pressed', 'rect', 'is_down', 'dark_overlay')
+
+    def __init__(self, x_pos, y_pos, img):
         """
         Create a button at specified position with an image.
-        
+
         Parameters
         ----------
         x_pos : int
             X coordinate of button center
         y_pos : int
             Y coordinate of button center
-        img_path : str
-            Path to button image file
-            
+        img : str or pygame.Surface
+            Path to the button image file, or an already-loaded surface
+            (used by tests to avoid a disk round-trip)
+
         Notes
         -----
         - Button rect is centered at (x_pos, y_pos)
         - Dark overlay is created with 120 alpha (semi-transparent)
         - Overlay has 5-pixel border radius for rounded corners
         """
-        # Load image
-        self.img = pygame.image.load(img_path).convert_alpha()
+        # Load image (shared across buttons using the same path)
+        if isinstance(img, pygame.Surface):
+            self.img = img
+        else:
+            self.img = _load(img)
         self.rect = self.img.get_rect(center=(x_pos, y_pos))
 
         # Press state
@@ -65,6 +144,11 @@ class Buttons:
             border_radius=5
         )
 
+        # Pre-composited pressed state: image + overlay merged once here,
+        # so draw() does a single blit either way
+        self.img_pressed = self.img.copy()
+        self.img_pressed.blit(self.dark_overlay, (0, 0))
+
     def draw(self, screen):
         """
         Render the button to the screen, with overlay if pressed.
@@ -76,14 +160,11 @@ class Buttons:
             
         Notes
         -----
-        - Always draws the base button image
-        - Draws dark overlay on top if is_down is True
+        - Blits the pre-composited pressed image when is_down is True,
+          otherwise the base image - one blit per frame either way
         - Should be called every frame in the main loop
         """
-        screen.blit(self.img, self.rect)
-
-        if self.is_down:
-            screen.blit(self.dark_overlay, self.rect.topleft)
+        screen.blit(self.img_pressed if self.is_down else self.img, self.rect)
 
     def handle_overlay(self, event):
         """
@@ -0,0 +1,63 @@
+"""Small numeric kernels shared by the render and input paths.
+
+Only pure math lives here - no pygame or GUI calls - so the functions
+can be JIT-compiled by numba when it is available. numba is optional:
+without it the same functions run as plain Python, so it never becomes
+a hard dependency of the player.
+"""
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator when numba is not installed: no-op."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def needle_offset(angle_deg, length):
+    """
+    Offset of the needle center from its pivot at a given angle.
+
+    Parameters
+    ----------
+    angle_deg : float
+        Needle angle in degrees
+    length : float
+        Distance from the pivot to the needle center
+
+    Returns
+    -------
+    tuple of float
+        (offset_x, offset_y) in screen coordinates
+    """
+    rad = math.radians(angle_deg)
+    return math.cos(rad) * length, math.sin(rad) * length
+
+
+@njit(cache=True, fastmath=True)
+def clamp01(x):
+    """
+    Clamp a value to the closed interval [0.0, 1.0].
+
+    Parameters
+    ----------
+    x : float
+        The value to clamp
+
+    Returns
+    -------
+    float
+        x limited to [0.0, 1.0]
+    """
+    if x < 0.0:
+        return 0.0
+    if x > 1.0:
+        return 1.0
+    return x
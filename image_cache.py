@@ -0,0 +1,69 @@
+"""Process-wide cache of loaded and converted image surfaces.
+
+Every image the player uses is decoded and converted at most once per
+path; repeat calls return the shared surface. Routing loads through
+here also keeps any future code path from quietly reintroducing a
+per-frame pygame.image.load.
+"""
+import pygame
+
+
+_cache = {}
+_width_cache = {}
+
+
+def get(path, alpha=True):
+    """
+    Load an image surface, sharing one decoded copy per path.
+
+    Parameters
+    ----------
+    path : str
+        Path to the image file
+    alpha : bool, optional
+        When True (default) the surface is converted with
+        convert_alpha(); when False with convert(), which blits
+        faster for fully opaque images.
+
+    Returns
+    -------
+    pygame.Surface
+        The converted surface; the same object is returned for every
+        later call with the same path.
+
+    Notes
+    -----
+    Requires the display mode to be set, since the conversion targets
+    the display format.
+    """
+    surface = _cache.get(path)
+    if surface is None:
+        img = pygame.image.load(path)
+        surface = img.convert_alpha() if alpha else img.convert()
+        _cache[path] = surface
+    return surface
+
+
+def get_width(path):
+    """
+    Width in pixels of an image, without keeping the surface resident.
+
+    Parameters
+    ----------
+    path : str
+        Path to the image file
+
+    Returns
+    -------
+    int
+        The image width; only the width is cached, so images loaded
+        just for layout measurements are freed again.
+    """
+    width = _width_cache.get(path)
+    if width is None:
+        surface = _cache.get(path)
+        if surface is None:
+            surface = pygame.image.load(path)
+        width = surface.get_width()
+        _width_cache[path] = width
+    return width
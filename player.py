@@ -2,18 +2,27 @@
 import os
 import sys
 import math
+import time
 
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "hide"
 import pygame
 import ctypes
 import tkinter as tk
 
+import image_cache
 from settings import Settings
-from buttons import Buttons
+from fastmath import clamp01, needle_offset
+from buttons import Buttons, dispatch_overlay
 from slider import Slider_UI
 from audio import AudioPlayer
 
 
+# (cos, sin) at 0.1 degree steps over the needle's 90.0-129.9 degree
+# travel, so the easing path never touches libm at runtime; built
+# through the fastmath kernel (unit length gives the raw cos/sin pair)
+_NEEDLE_TRIG = [needle_offset(a / 10.0, 1.0) for a in range(900, 1300)]
+
+
 class Player_Window:
     """
     Main music player window with Pygame UI and Tkinter file dialogs.
@@ -72,6 +81,26 @@ class Player_Window:
         except Exception:
             pass
 
+        # On Windows, ask for 1 ms sleep resolution so the frame pacing
+        # sleep doesn't overshoot by the default 15.6 ms scheduler tick
+        try:
+            ctypes.windll.winmm.timeBeginPeriod(1)
+        except Exception:
+            pass
+
+        # Frame pacing state (deadline is set when start_player runs)
+        self._frame_interval = 1.0 / 60.0
+        self._next_frame_time = 0.0
+
+        # The only event types the frame loop dispatches on; the queue
+        # drain is filtered to exactly these
+        self._input_event_types = (
+            pygame.QUIT,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP,
+            pygame.MOUSEMOTION,
+        )
+
         player_settings = Settings()
 
         # Tkinter root for file dialogs (hidden)
@@ -87,36 +116,81 @@ class Player_Window:
         )
         self.screen = pygame.display.get_surface()
         pygame.display.set_caption("Vibe")
-        pygame.display.set_icon(pygame.image.load("Images/set_icon.png"))
+        pygame.display.set_icon(image_cache.get("Images/set_icon.png"))
+
+        # Drop event types we never handle at the SDL queue boundary, so
+        # the per-frame event list only ever contains quit + mouse input
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([
+            pygame.QUIT,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP,
+            pygame.MOUSEMOTION,
+        ])
 
         # Background image / color
-        self.background_img = pygame.image.load("Images/Frame_1.png").convert()
+        self.background_img = image_cache.get("Images/Frame_1.png", alpha=False)
         self.background_img = pygame.transform.scale(
             self.background_img,
             (player_settings.screen_width, player_settings.screen_height)
         )
         self.background_color = player_settings.screen_colour
 
-        options_menu_img = pygame.image.load("Images/Frame_2.png")
+        options_menu_img = image_cache.get("Images/Frame_2.png")
         self.rounded_img = self.make_rounded_image(options_menu_img, 20)
         self.flip_state = False
 
+        # Platter and needle surfaces, loaded once instead of per frame
+        self.platter_img = image_cache.get("Images/disk.png")
+        self.needle_img = image_cache.get("Images/needle.png")
+
+        # Pre-rotated platter table: one surface and rect per integer
+        # degree, so each frame is a lookup + blit instead of a resample
+        platter_center_rect = self.platter_img.get_rect(center=(328, 367))
+        self.platter_rotations = []
+        self.platter_rects = []
+        for degree in range(360):
+            rotated = pygame.transform.rotate(self.platter_img, degree)
+            self.platter_rotations.append(rotated)
+            self.platter_rects.append(
+                rotated.get_rect(center=platter_center_rect.center)
+            )
+
+        # Rotated needle surfaces memoized at 0.5 degree granularity; the
+        # easing converges on the two target angles so this stays small
+        self._needle_cache = {}
+
+        # Last drawn needle state: lets _move_needle skip the trig and
+        # rect math entirely while the needle is at rest
+        self._last_needle_drawn_angle = None
+        self._last_needle_surf = None
+        self._last_needle_rect = None
+
         # Buttons
         self._buttons_init()
 
         # Playlist and audio
         self.audio = AudioPlayer(self)
 
+        # Unconditional click handlers as (button, action) pairs; clicks
+        # with extra conditions stay explicit in the event loop
+        self._click_targets = (
+            (self.next_bnt, self.audio.next_song),
+            (self.previous_bnt, self.audio.previous_song),
+        )
+
         # Sliders
         self.volume_slider = Slider_UI(
             rect=pygame.Rect(785, 539, 255, 10),
             on_click=self.audio.change_volume,
-            value=0.5
+            value=0.5,
+            settings=player_settings
         )
         self.music_slider = Slider_UI(
             rect=pygame.Rect(745.6, 366, 330, 7),
             on_click=self.audio.adjust_song,
-            value=0
+            value=0,
+            settings=player_settings
         )
 
         # Platter rotation
@@ -127,12 +201,100 @@ class Player_Window:
         self.target_needle_angle_playing = 129
         self.target_needle_angle_paused = 90
 
+        # Shared fonts plus a cache of rendered text surfaces: duration
+        # strings repeat for many frames, so rasterize each one once
+        self._fonts = {
+            20: pygame.font.Font(None, 20),
+            25: pygame.font.Font(None, 25),
+            30: pygame.font.Font(None, 30),
+        }
+        self._text_cache = {}
+
         # Scrolling text
         self.scroll_area_x = 882
-        self.scroll_area_width = pygame.image.load("Images/song_name_Rectangle.png").get_width() - 39
+        self.scroll_area_width = image_cache.get_width("Images/song_name_Rectangle.png") - 39
         self.scroll_text_x = self.scroll_area_x
         self.scroll_speed = 0.25
 
+        # Dirty-region rendering: the background is painted in full only
+        # on the first frame (and after the menu toggles); afterwards
+        # just the regions that animate are restored and pushed
+        self._dirty_regions = self._build_dirty_regions()
+        self._needs_full_redraw = True
+
+        # Idle-frame flag: when nothing is animating and no input came
+        # in, the frame skips rendering entirely and just sleeps
+        self._dirty_frame = True
+
+    def _build_dirty_regions(self):
+        """
+        Compute the fixed screen regions that change between frames.
+
+        Returns
+        -------
+        tuple of pygame.Rect
+            Rects covering the platter, needle sweep, text areas,
+            buttons, and sliders - everything the per-frame renderers
+            touch. The rest of the window is static background.
+
+        Notes
+        -----
+        - The platter region is the union of every pre-rotated rect
+        - The needle region is the union of its rect over the full
+          easing sweep between the paused and playing angles
+        - Slider rects are inflated to cover the knob overhang
+        - All regions are clipped to the screen
+        """
+        screen_rect = self.screen.get_rect()
+
+        platter_region = self.platter_rects[0].copy()
+        for rect in self.platter_rects:
+            platter_region.union_ip(rect)
+
+        # Sweep the needle over its full travel once to bound its rect
+        pivot_x, pivot_y = 328 + 212, 367 - 32
+        needle_length = self.needle_img.get_height()
+        needle_region = None
+        for tenth in range(900, 1300 + 1, 5):
+            angle = tenth / 10
+            rotated = pygame.transform.rotate(self.needle_img, -angle + 90)
+            rect = rotated.get_rect()
+            rad_angle = math.radians(angle)
+            rect.centerx = int(pivot_x + math.cos(rad_angle) * (needle_length / 4))
+            rect.centery = int(pivot_y + math.sin(rad_angle) * (needle_length / 4))
+            if needle_region is None:
+                needle_region = rect
+            else:
+                needle_region.union_ip(rect)
+
+        menu_region = pygame.Rect((11, 0), self.rounded_img.get_size())
+        menu_region.union_ip(self.ellipse_bnt.rect)
+
+        controls_region = self.current_icon.rect.copy()
+        controls_region.union_ip(self.next_bnt.rect)
+        controls_region.union_ip(self.previous_bnt.rect)
+
+        loop_region = self.loop_background.rect.copy()
+        loop_region.union_ip(self.current_loop_icon.rect)
+
+        regions = (
+            platter_region,
+            needle_region,
+            menu_region,
+            controls_region,
+            loop_region,
+            # Scrolling title and artist text
+            pygame.Rect(self.scroll_area_x, 95, self.scroll_area_width, 40),
+            pygame.Rect(self.scroll_area_x, 147, self.scroll_area_width, 35),
+            # Position / duration readouts
+            pygame.Rect(743, 385, 60, 20),
+            pygame.Rect(1055, 385, 60, 20),
+            # Sliders, inflated for the knob overhang
+            self.volume_slider.rect.inflate(24, 24),
+            self.music_slider.rect.inflate(24, 24),
+        )
+        return tuple(region.clip(screen_rect) for region in regions)
+
     def _buttons_init(self):
         """
         Initialize all button objects with their positions and images.
@@ -168,106 +330,215 @@ class Player_Window:
 
         self.current_loop_icon = self.loop_off_bnt
 
+        # Static buttons resolved once; current_icon/current_loop_icon
+        # swap at runtime so they are dispatched separately
+        self._overlay_targets = (
+            self.next_bnt,
+            self.previous_bnt,
+            self.ellipse_bnt,
+            self.add_button,
+            self.cancel_bnt,
+            self.loop_background,
+        )
+
     def start_player(self):
         """
         Start the main game loop at 60 FPS.
-        
-        This method runs indefinitely until the user closes the window.
+
+        This method runs indefinitely until the user closes the window,
+        calling _tick() once per frame.
+
+        Notes
+        -----
+        - Runs at 60 FPS using a perf_counter-based frame deadline
+        - Exits cleanly with pygame.quit() and sys.exit()
+        - The per-frame body lives in _tick as one flat method so
+          alternative runtimes (PyPy's tracing JIT, CPython's adaptive
+          interpreter) can specialize it as a single unit
+        """
+        self._next_frame_time = time.perf_counter() + self._frame_interval
+
+        while True:
+            self._tick()
+
+    def _tick(self):
+        """
+        Run one frame of the player: handle input, update state, draw.
+
+        Notes
+        -----
         Each frame:
-        1. Draws background and UI elements
+        1. Processes all user input events
         2. Updates song position display
         3. Rotates platter if playing
         4. Animates needle position
         5. Updates progress slider
-        6. Processes all user input events
-        
+        6. Draws background and UI elements, then flips and sleeps
+
+        Events are drained at the top of the frame so the state they
+        change is drawn in the same frame; pacing with time.sleep against
+        a perf_counter deadline yields the CPU instead of busy-waiting
+        the way pygame.time.Clock.tick can on some platforms.
+        """
+        # Bind the hot attribute chains to locals once per frame; the
+        # swapping icons (current_icon/current_loop_icon) are excluded
+        # because the loop body reassigns them
+        audio = self.audio
+        screen = self.screen
+        background_img = self.background_img
+        volume_slider = self.volume_slider
+        music_slider = self.music_slider
+
+        # Event handling first, so a click is visible this frame; the
+        # drain is filtered to input events, so anything else a driver
+        # or library posts never enters the dispatch chain
+        for event in pygame.event.get(self._input_event_types):
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+            # Presses/releases (and motion while a slider drags) change
+            # what the next frame shows; bare hover motion does not
+            if (event.type != pygame.MOUSEMOTION
+                    or volume_slider.dragging
+                    or music_slider.dragging):
+                self._dirty_frame = True
+
+            # Sliders see every event (motion drives dragging)
+            volume_slider.handle_event(event)
+            music_slider.handle_event(event)
+
+            # Buttons only react to press/release, so the frequent
+            # MOUSEMOTION stream skips the whole dispatch chain
+            if event.type == pygame.MOUSEMOTION:
+                continue
+
+            # Update overlay/press state (one batched hit-test for
+            # the static buttons, the two swapping icons separately)
+            dispatch_overlay(self._overlay_targets, event)
+            self.current_icon.handle_overlay(event)
+            self.current_loop_icon.handle_overlay(event)
+
+            # Button clicks
+            if self.current_icon.was_clicked(event):
+                audio.toggle_play_pause()
+
+            for button, action in self._click_targets:
+                if button.was_clicked(event):
+                    action()
+
+            # Loop button click handler
+            if self.current_loop_icon.was_clicked(event):
+                loop_mode = audio.toggle_loop_mode()
+                if loop_mode == 0:
+                    self.current_loop_icon = self.loop_off_bnt
+                elif loop_mode == 1:
+                    self.current_loop_icon = self.loop_all_bnt
+                else:
+                    self.current_loop_icon = self.loop_one_bnt
+
+            if self.add_button.was_clicked(event):
+                if self.flip_state:
+                    audio.add_songs()
+
+            if self.cancel_bnt.was_clicked(event):
+                self.close_options_menu()
+
+            if self.ellipse_bnt.was_clicked(event):
+                self.open_options_menu()
+
+        # One timestamp per frame, shared by every position consumer
+        now_ticks = pygame.time.get_ticks()
+        audio.poll_ingest()
+        audio.flush_pending_seek()
+        audio.update_current_position(now_ticks)
+        audio.check_song_end()
+
+        # Update progress slider during playback
+        if audio.is_playing and not music_slider.dragging:
+            if audio.song_length > 0:
+                current_pos = audio.get_current_position(now_ticks)
+                music_slider.value = clamp01(current_pos / audio.song_length)
+
+        # Animation sources: playback (platter + position readout), a
+        # needle still easing home, or title/artist text mid-scroll
+        if (audio.is_playing
+                or self.needle_angle != self.target_needle_angle_paused
+                or self._scroll_active()):
+            self._dirty_frame = True
+
+        # Nothing moved and no input arrived: skip rendering outright
+        if not self._dirty_frame:
+            self._sleep_until_next_frame()
+            return
+        self._dirty_frame = False
+
+        # Restore the background only where something animates; a full
+        # repaint happens on the first frame and after menu toggles
+        if self._needs_full_redraw:
+            screen.fill(self.background_color)
+            screen.blit(background_img, (0, 0))
+            update_rects = None
+            self._needs_full_redraw = False
+        else:
+            blit = screen.blit
+            for region in self._dirty_regions:
+                blit(background_img, region, region)
+            update_rects = self._dirty_regions
+
+        self._rotate_platter()
+        self._display_music_meta_data()
+        self._move_needle()
+        self._draw_buttons()
+
+        if update_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(update_rects)
+
+        self._sleep_until_next_frame()
+
+    def _sleep_until_next_frame(self):
+        """
+        Sleep until the next 60 FPS deadline.
+
         Notes
         -----
-        - Runs at 60 FPS using pygame.time.Clock
-        - Handles all mouse/keyboard events
-        - Exits cleanly with pygame.quit() and sys.exit()
+        Paces the loop with time.sleep against a perf_counter deadline;
+        if the frame ran long, the deadline is rebased instead of
+        trying to catch up.
         """
-        clock = pygame.time.Clock()
-        
-        while True:
-            # Draw background and UI
-            self.screen.fill(self.background_color)
-            self.screen.blit(self.background_img, (0, 0))
+        now = time.perf_counter()
+        delay = self._next_frame_time - now
+        if delay > 0:
+            time.sleep(delay)
+            self._next_frame_time += self._frame_interval
+        else:
+            self._next_frame_time = now + self._frame_interval
 
-            self.audio.update_current_position() 
-            
-            self._rotate_platter()
-            self._display_music_meta_data()
-            self._move_needle()
-
-            # Draw UI elements
-            self._draw_buttons()
-
-            # Update progress slider during playback
-            if self.audio.is_playing and not self.music_slider.dragging:
-                if self.audio.song_length > 0:
-                    current_pos = self.audio.get_current_position()
-                    slider_value = min(1.0, current_pos / self.audio.song_length)
-                    self.music_slider.value = slider_value
-            
-            pygame.display.flip()
-            clock.tick(60)
-
-            # Event handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                
-                # Detect when music ends
-                if event.type == pygame.USEREVENT + 1:
-                    self.audio.on_song_end()
-
-                # Update overlay/press state
-                self.current_icon.handle_overlay(event)
-                self.next_bnt.handle_overlay(event)
-                self.previous_bnt.handle_overlay(event)
-                self.ellipse_bnt.handle_overlay(event)
-                self.add_button.handle_overlay(event)
-                self.cancel_bnt.handle_overlay(event)
-                self.loop_background.handle_overlay(event)
-                self.current_loop_icon.handle_overlay(event)
-
-                # Sliders
-                self.volume_slider.handle_event(event)
-                self.music_slider.handle_event(event)
-
-                # Button clicks
-                try:
-                    if self.current_icon.was_clicked(event):
-                        self.audio.toggle_play_pause()
-                except AttributeError:
-                    pass
-
-                if self.next_bnt.was_clicked(event):
-                    self.audio.next_song()
-                if self.previous_bnt.was_clicked(event):
-                    self.audio.previous_song()
-
-                # Loop button click handler
-                if self.current_loop_icon.was_clicked(event):
-                    loop_mode = self.audio.toggle_loop_mode()
-                    if loop_mode == 0:
-                        self.current_loop_icon = self.loop_off_bnt
-                    elif loop_mode == 1:
-                        self.current_loop_icon = self.loop_all_bnt
-                    else:
-                        self.current_loop_icon = self.loop_one_bnt
-
-                if self.add_button.was_clicked(event):
-                    if self.flip_state:
-                        self.audio.add_songs()
-
-                if self.cancel_bnt.was_clicked(event):
-                    self.close_options_menu()
-
-                if self.ellipse_bnt.was_clicked(event):
-                    self.open_options_menu()
+    def _scroll_active(self):
+        """
+        Report whether the title/artist marquee is currently animating.
+
+        Returns
+        -------
+        bool
+            True when either rendered string is wider than the scroll
+            area and therefore moves every frame.
+
+        Notes
+        -----
+        Uses the shared text cache, so the width checks are dictionary
+        lookups on all but the first frame a string appears.
+        """
+        if not self.audio.current_song_title and not self.audio.current_song_artist:
+            title, artist = "Nothing Playing.", "Unknown Artist."
+        else:
+            title = str(self.audio.current_song_title)
+            artist = str(self.audio.current_song_artist)
+
+        return (self._render_cached(title, 30).get_width() > self.scroll_area_width
+                or self._render_cached(artist, 25).get_width() > self.scroll_area_width)
 
     def _draw_buttons(self):
         """
@@ -306,26 +577,24 @@ class Player_Window:
     def _rotate_platter(self):
         """
         Rotate and render the vinyl platter graphic.
-        
-        Loads the disk image, rotates it by the current angle if music
-        is playing, and blits it to the screen at the platter position.
-        
+
+        Advances the rotation angle while music is playing and blits the
+        matching entry from the pre-rotated surface table built in
+        __init__.
+
         Notes
         -----
         - Platter only rotates when audio.is_playing is True
         - Rotation angle increments by 1 degree per frame (60°/second)
         - Angle wraps around at 360 degrees
-        - Image is loaded fresh each frame (could be optimized by caching)
+        - Rotation itself happened once at startup; per frame this is a
+          table lookup and a blit
         """
-        platter = pygame.image.load(r"Images/disk.png").convert_alpha()
-        
         if self.audio.is_playing:
             self.angle = (self.angle + 1) % 360
-            
-        rotated_platter = pygame.transform.rotate(platter, self.angle)
-        platter_rect = platter.get_rect(center=(328, 367))
-        r_rect = rotated_platter.get_rect(center=platter_rect.center)
-        self.screen.blit(rotated_platter, r_rect)
+
+        index = int(self.angle) % 360
+        self.screen.blit(self.platter_rotations[index], self.platter_rects[index])
 
     def _move_needle(self):
         """
@@ -342,46 +611,106 @@ class Player_Window:
         -----
         - Needle angle smoothly transitions with 15% easing per frame
         - Pivot point is offset from platter center
-        - Image is loaded fresh each frame (could be optimized)
+        - Uses the surface cached in __init__
         - Rotation and positioning use trigonometry for realistic movement
+        - While the needle sits at its target (most frames) the cached
+          surface and rect from the last computation are re-blitted and
+          the trig is skipped entirely
         """
-        needle_img = pygame.image.load(r"Images/needle.png").convert_alpha()
-       
+        needle_img = self.needle_img
+
+
         platter_center = (328, 367)
-        
+
         # Determine target angle based on playback state
         target_angle = self.target_needle_angle_playing if self.audio.is_playing else self.target_needle_angle_paused
-        
+
         # Smoothly interpolate to target angle
         angle_diff = target_angle - self.needle_angle
         if abs(angle_diff) > 0.1:
             self.needle_angle += angle_diff * 0.15
         else:
             self.needle_angle = target_angle
-        
+
+        # Steady state: nothing moved since last frame, reuse the blit
+        if (self.needle_angle == self._last_needle_drawn_angle
+                and self._last_needle_surf is not None):
+            self.screen.blit(self._last_needle_surf, self._last_needle_rect)
+            return
+
         # Fixed pivot point
         pivot_x = platter_center[0] + 212
         pivot_y = platter_center[1] - 32
-        
-        rad_angle = math.radians(self.needle_angle)
+
         needle_length = needle_img.get_height()
-        
-        # Rotate the needle image
-        rotated_needle = pygame.transform.rotate(needle_img, -self.needle_angle + 90)
+
+        # Rotate the needle image (memoized at 0.5 degree steps)
+        cache_key = round(self.needle_angle * 2)
+        rotated_needle = self._needle_cache.get(cache_key)
+        if rotated_needle is None:
+            rotated_needle = pygame.transform.rotate(needle_img, -self.needle_angle + 90)
+            self._needle_cache[cache_key] = rotated_needle
 
         # Position with pivot offset
         needle_rect = rotated_needle.get_rect()
         needle_rect.center = (pivot_x, pivot_y)
         
-        offset_x = math.cos(rad_angle) * (needle_length/4)
-        offset_y = math.sin(rad_angle) * (needle_length/4)
-        
+        # Trig from the precomputed table (clamped to its 90-129.9 range)
+        idx = int(self.needle_angle * 10) - 900
+        if idx < 0:
+            idx = 0
+        elif idx > 399:
+            idx = 399
+        cos_a, sin_a = _NEEDLE_TRIG[idx]
+        offset_x = cos_a * (needle_length / 4)
+        offset_y = sin_a * (needle_length / 4)
+
+
         needle_rect.centerx = int(pivot_x + offset_x)
         needle_rect.centery = int(pivot_y + offset_y)
-        
+
+        self._last_needle_drawn_angle = self.needle_angle
+        self._last_needle_surf = rotated_needle
+        self._last_needle_rect = needle_rect
+
         self.screen.blit(rotated_needle, needle_rect)
 
 
+    def _render_cached(self, text: str, font_size: int):
+        """
+        Render text to a surface, reusing cached renders.
+
+        Parameters
+        ----------
+        text : str
+            The text to render
+        font_size : int
+            Font size in pixels
+
+        Returns
+        -------
+        pygame.Surface
+            The rendered text surface, served from a (font_size, text)
+            keyed cache so repeated strings skip rasterization
+
+        Notes
+        -----
+        - Fonts are constructed once per size and kept in self._fonts
+        - The cache is capped at 256 entries (oldest dropped first)
+        """
+        key = (font_size, text)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            font = self._fonts.get(font_size)
+            if font is None:
+                font = pygame.font.Font(None, font_size)
+                self._fonts[font_size] = font
+            surface = font.render(text, True, (0, 0, 0))
+            if len(self._text_cache) >= 256:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            self._text_cache[key] = surface
+        return surface
+
     def render_music_duration(self, text: str, font_size: int, x: int, y: int):
         """
         Render time duration text at specified screen coordinates.
@@ -402,10 +731,10 @@ class Player_Window:
         - Uses system default font (None)
         - Text is rendered in black (0, 0, 0)
         - Called to display both current position and total duration
+        - Rendering goes through the shared text cache, so a string that
+          was on screen last frame costs only a blit
         """
-        font = pygame.font.SysFont(None, font_size)
-        text_surface = font.render(text, True, (0, 0, 0))
-        self.screen.blit(text_surface, (x, y))
+        self.screen.blit(self._render_cached(text, font_size), (x, y))
 
 
     def _render_text(self, text: str, font_size: int, y: int):
@@ -431,15 +760,28 @@ class Player_Window:
         - Scroll speed controlled by self.scroll_speed (0.25 px/frame)
         - Uses white background for clipped area
         - Text position resets when it scrolls completely off left side
+        - The text surface comes from the shared cache; only the scroll
+          offset changes per frame
+        - Draws directly onto the screen under a clip rect instead of
+          round-tripping through a temporary surface, so no per-frame
+          allocation
         """
-        font = pygame.font.SysFont(None, font_size)
-        text_surface = font.render(text, True, (0, 0, 0))
+        text_surface = self._render_cached(text, font_size)
         text_width = text_surface.get_width()
 
-        scroll_surface = pygame.Surface((self.scroll_area_width, font_size))
-        scroll_surface.fill((255, 255, 255))
-        scroll_surface.blit(text_surface, (self.scroll_text_x - self.scroll_area_x, 8))
-        self.screen.blit(scroll_surface, (self.scroll_area_x, y))
+        # Text that fits needs no scrolling: one blit at a fixed spot,
+        # no clip rect and no scroll-offset bookkeeping
+        if text_width <= self.scroll_area_width:
+            self.screen.blit(text_surface, (self.scroll_area_x, y + 8))
+            return
+
+        clip_rect = pygame.Rect(
+            self.scroll_area_x, y, self.scroll_area_width, font_size
+        )
+        self.screen.set_clip(clip_rect)
+        self.screen.fill((255, 255, 255), clip_rect)
+        self.screen.blit(text_surface, (self.scroll_text_x, y + 8))
+        self.screen.set_clip(None)
 
         # Update scroll position
         self.scroll_text_x -= self.scroll_speed
@@ -487,6 +829,7 @@ class Player_Window:
         of the normal ellipse menu button.
         """
         self.flip_state = True
+        self._needs_full_redraw = True
 
     def close_options_menu(self):
         """
@@ -496,6 +839,7 @@ class Player_Window:
         the normal ellipse menu button instead of the options overlay.
         """
         self.flip_state = False
+        self._needs_full_redraw = True
 
     def make_rounded_image(self, img: pygame.Surface, radius: int):
         """
@@ -5,29 +5,21 @@ class Settings:
 
     This class centralizes color choices, screen dimensions, and slider
     appearance settings so they can be reused across multiple modules.
+    The values are class-level constants: every module reads the same
+    settings, so instantiating the class allocates nothing new.
     """
 
-    def __init__(self):
-        """
-        Initialize default settings for screen size, colors, and slider styling.
-        """
-
-        #Screen settings
-        #main menu
-        self.screen_colour = (200,200,200)
-        self.screen_height = 700
-        self.screen_width = 1200
-    
-        
-        #options menu 
-        self.screen_op_height = 700
-        self.screen_op_width = 335
-        self.screen_colour = (170, 170, 170)
-
-        #slider settings
-        self.slider_knob_color = (50,50,50)
-        self.slider_bg_color = (100, 100, 100)
-        self.slider_filled_color = (255, 255, 255)
-
+    #Screen settings
+    #main menu
+    screen_colour = (170, 170, 170)
+    screen_height = 700
+    screen_width = 1200
 
+    #options menu
+    screen_op_height = 700
+    screen_op_width = 335
 
+    #slider settings
+    slider_knob_color = (50,50,50)
+    slider_bg_color = (100, 100, 100)
+    slider_filled_color = (255, 255, 255)
@@ -16,7 +16,7 @@ class Slider_UI:
     - Customizable colors via Settings
     """
 
-    def __init__(self, rect: pygame.Rect,  on_click: Callable[[float], None], value: float = 0.0):
+    def __init__(self, rect: pygame.Rect,  on_click: Callable[[float], None], value: float = 0.0, settings: Settings = None):
         """
         Create a slider control.
 
@@ -28,14 +28,35 @@ class Slider_UI:
             A callback triggered whenever the slider's value changes.
         value : float, optional
             Initial slider value in [0.0, 1.0], by default 0.0.
+        settings : Settings, optional
+            Shared UI settings; the caller's instance is reused when
+            given, otherwise the module defaults are used.
         """
         self.rect = rect
         self.value = value
         self.on_click = on_click
         self.dragging = False
 
-        # Load shared UI settings
-        self.slider_settings = Settings()
+        # Degenerate widths are resolved here once so the per-motion
+        # path is a subtract and a multiply instead of a guard + divide
+        self._x = rect.x
+        self._inv_width = 1.0 / rect.width if rect.width > 0 else 0.0
+
+        # Shared UI settings (the values are class-level constants, so
+        # falling back to the class itself allocates nothing)
+        self.slider_settings = settings if settings is not None else Settings
+
+        # Static draw geometry, computed once: draw() runs twice per
+        # frame and only the fill width / knob x actually change
+        self._size = max(6, self.rect.height // 2) * 2
+        self._radius = self._size // 4
+        self._fill_rect = pygame.Rect(self.rect.x, self.rect.y, 0, self.rect.height)
+        self._knob_rect = pygame.Rect(
+            0, self.rect.centery - self._size // 2, self._size, self._size
+        )
+        self._bg_color = self.slider_settings.slider_bg_color
+        self._fill_color = self.slider_settings.slider_filled_color
+        self._knob_color = self.slider_settings.slider_knob_color
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """
@@ -71,13 +92,13 @@ class Slider_UI:
             The (x, y) mouse position.
         """
 
-        # Prevent division by zero or invalid space
-        if self.rect.width <= 0:
-            return
-    
         # Convert absolute mouse X into a normalized slider value
-        relative_x = pos[0] - self.rect.x
-        new_value = max(0.0, min(1.0, relative_x / self.rect.width))
+        # (inlined clamp: this runs on every MOUSEMOTION while dragging)
+        new_value = (pos[0] - self._x) * self._inv_width
+        if new_value < 0.0:
+            new_value = 0.0
+        elif new_value > 1.0:
+            new_value = 1.0
 
         # Only trigger callback if value truly changed
         if abs(new_value - self.value) > 1e-6:
@@ -95,23 +116,21 @@ class Slider_UI:
             The Pygame surface on which to render the slider.
         """
 
-        # knob size (square)
-        size = max(6, self.rect.height // 2) * 2
-        radius = size // 4
+        radius = self._radius
 
         # Background bar
-        pygame.draw.rect(surface, self.slider_settings.slider_bg_color , self.rect, border_radius=radius)
+        pygame.draw.rect(surface, self._bg_color, self.rect, border_radius=radius)
 
-        # Filled section
+        # Filled section (preallocated rect, only the width changes)
         fill_width = int(self.rect.width * self.value)
-        fill_rect = pygame.Rect(self.rect.x, self.rect.y, fill_width, self.rect.height)
-        pygame.draw.rect(surface, self.slider_settings.slider_filled_color, fill_rect, border_radius=radius)
-        
-        # Knob placement
+        self._fill_rect.width = fill_width
+        pygame.draw.rect(surface, self._fill_color, self._fill_rect, border_radius=radius)
+
+        # Knob placement (preallocated rect, only the x changes)
         knob_x = self.rect.x + fill_width
         knob_x = max(self.rect.x, min(knob_x, self.rect.right))
-        knob_rect = pygame.Rect( knob_x - size // 2,self.rect.centery - size // 2, size, size)
-        pygame.draw.rect(surface, self.slider_settings.slider_knob_color, knob_rect, border_radius=radius)
+        self._knob_rect.x = knob_x - self._size // 2
+        pygame.draw.rect(surface, self._knob_color, self._knob_rect, border_radius=radius)
         
 
 
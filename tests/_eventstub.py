@@ -0,0 +1,26 @@
+"""Lightweight stand-in for pygame.event.Event in unit tests.
+
+The handlers under test only read attributes (event.type, event.pos,
+event.button), so a SimpleNamespace is indistinguishable to them while
+skipping pygame's C-level event allocation.
+"""
+import types
+
+
+def mk_event(event_type, **attrs):
+    """
+    Build a duck-typed event carrying only the fields a test needs.
+
+    Parameters
+    ----------
+    event_type : int
+        The pygame event type constant (e.g. pygame.MOUSEBUTTONDOWN)
+    **attrs
+        Additional event attributes, such as pos or button
+
+    Returns
+    -------
+    types.SimpleNamespace
+        An object exposing .type plus the given attributes
+    """
+    return types.SimpleNamespace(type=event_type, **attrs)
@@ -1,10 +1,59 @@
 """Shared pytest fixtures for all tests."""
-from unittest.mock import Mock, MagicMock
+import copy
+import os
+from unittest.mock import Mock
 import pytest
 import pygame
 
-# Mock pygame.mixer globally for all tests
-pygame.mixer = MagicMock()
+
+class _StubMusic:
+    """No-op stand-in for pygame.mixer.music.
+
+    Unlike a MagicMock, attribute access allocates nothing and keeps no
+    call bookkeeping; tests that need to assert on calls patch the
+    individual attribute, which turns just that one into a real mock.
+    """
+    load = staticmethod(lambda *args, **kwargs: None)
+    play = staticmethod(lambda *args, **kwargs: None)
+    pause = staticmethod(lambda *args, **kwargs: None)
+    unpause = staticmethod(lambda *args, **kwargs: None)
+    stop = staticmethod(lambda *args, **kwargs: None)
+    set_pos = staticmethod(lambda *args, **kwargs: None)
+    set_volume = staticmethod(lambda *args, **kwargs: None)
+    set_endevent = staticmethod(lambda *args, **kwargs: None)
+    get_busy = staticmethod(lambda: False)
+    # -1 matches a stopped real mixer, so position logic takes the
+    # wall-clock fallback path the tests drive via get_ticks
+    get_pos = staticmethod(lambda: -1)
+
+
+class _StubMixer:
+    """No-op stand-in for the pygame.mixer module."""
+    music = _StubMusic()
+    init = staticmethod(lambda *args, **kwargs: None)
+    quit = staticmethod(lambda *args, **kwargs: None)
+    get_init = staticmethod(lambda: True)
+
+
+# Replace pygame.mixer globally for all tests: no audio device is
+# available (or wanted) under the test runner
+pygame.mixer = _StubMixer()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _pygame_session():
+    """Initialize pygame and a display once for the whole session.
+
+    SDL's dummy video driver skips real window/GL-context creation, so
+    this also works on headless CI. SDL init is the dominant fixed cost
+    of the suite; doing it once replaces the per-module (previously
+    even per-test) init/quit cycles.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
 
 
 @pytest.fixture
@@ -30,16 +79,43 @@ def audio_player(mock_player_window):
             return player
 
 
+@pytest.fixture(scope="session")
+def _base_player_with_playlist():
+    """Construct the playlist-loaded AudioPlayer once per session."""
+    from audio import AudioPlayer
+
+    window = Mock()
+    window.root = Mock()
+    window.pause_bnt = Mock()
+    window.play_bnt = Mock()
+    window.current_icon = Mock()
+
+    player = AudioPlayer(window)
+    player.playlist = ["song1.mp3", "song2.mp3", "song3.mp3"]
+    player.song_length = 180
+    player.AUDIO_OK = True
+    return player
+
+
 @pytest.fixture
-def audio_player_with_playlist(mock_player_window):
-    """Create audio player with a pre-loaded playlist."""
-    from unittest.mock import patch
-    
-    with patch('pygame.mixer.init'):
-        with patch('pygame.mixer.music.set_endevent'):
-            from audio import AudioPlayer
-            player = AudioPlayer(mock_player_window)
-            player.playlist = ["song1.mp3", "song2.mp3", "song3.mp3"]
-            player.song_length = 180
-            player.AUDIO_OK = True
-            return player
\ No newline at end of file
+def audio_player_with_playlist(_base_player_with_playlist):
+    """Create audio player with a pre-loaded playlist.
+
+    Implemented as a shallow copy of the session-scoped base player:
+    the state is scalars plus a few small containers, so copying is
+    much cheaper than reconstructing. The mutable pieces are re-bound
+    and the scalars reset so no state leaks between tests.
+    """
+    player = copy.copy(_base_player_with_playlist)
+    player.playlist = list(_base_player_with_playlist.playlist)
+    player._meta_by_key = {}
+    player._pending_seek = None
+    player._last_seek_ticks = -1000
+    player._pending_playlist = None
+    player.index = 0
+    player.is_playing = False
+    player.paused = False
+    player.seek_offset = 0
+    player.last_update_time = 0
+    player._last_pos_sec = -1
+    return player
\ No newline at end of file
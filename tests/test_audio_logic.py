@@ -1,10 +1,11 @@
 """Unit tests for AudioPlayer logic."""
-from unittest.mock import patch, MagicMock
-import pygame
+import io
+from unittest.mock import patch, DEFAULT
 
-# Mock pygame.mixer before importing
-pygame.mixer = MagicMock()
+import pytest
 
+# pygame.mixer is replaced with a lightweight stub in conftest.py,
+# which runs before this module is imported
 
 
 
@@ -26,25 +27,20 @@ class TestAudioPlayerInitialization:
 
 class TestTimeConversion:
     """Test time conversion utilities."""
-    
-    def test_convert_sec_min_zero_seconds(self, audio_player):
-        """Test time conversion for 0 seconds."""
-        assert audio_player.convert_sec_min(0) == "0:00"
-    
-    def test_convert_sec_min_one_minute(self, audio_player):
-        """Test time conversion for exactly 1 minute."""
-        assert audio_player.convert_sec_min(60) == "1:00"
-    
-    def test_convert_sec_min_with_seconds(self, audio_player):
-        """Test time conversion with minutes and seconds."""
-        assert audio_player.convert_sec_min(65) == "1:05"
-        assert audio_player.convert_sec_min(125) == "2:05"
-        assert audio_player.convert_sec_min(3661) == "61:01"
-    
-    def test_convert_sec_min_handles_floats(self, audio_player):
-        """Test time conversion with float input."""
-        assert audio_player.convert_sec_min(65.7) == "1:05"
-        assert audio_player.convert_sec_min(89.9) == "1:29"
+
+    @pytest.mark.parametrize("seconds,expected", [
+        (0, "0:00"),
+        (60, "1:00"),
+        (65, "1:05"),
+        (125, "2:05"),
+        (3661, "61:01"),
+        # Floats truncate toward zero
+        (65.7, "1:05"),
+        (89.9, "1:29"),
+    ])
+    def test_convert_sec_min(self, audio_player, seconds, expected):
+        """Test time conversion across whole-second and float inputs."""
+        assert audio_player.convert_sec_min(seconds) == expected
 
 
 class TestLoopMode:
@@ -178,71 +174,84 @@ class TestSongSeeking:
         mock_ticks.return_value = 5000
         
         audio_player_with_playlist.adjust_song(1.0)
-        
+
         mock_set_pos.assert_called_once_with(180.0)
         assert audio_player_with_playlist.seek_offset == 180.0
 
+    @patch('audio.pygame.mixer.music.set_pos')
+    @patch('audio.pygame.time.get_ticks')
+    def test_rapid_seeks_coalesce_to_latest(self, mock_ticks, mock_set_pos, audio_player_with_playlist):
+        """Test back-to-back seeks apply the first and flush the latest."""
+        mock_ticks.return_value = 5000
+
+        # Three seeks inside one throttle window: the first goes out
+        # immediately, the rest only update the pending position
+        audio_player_with_playlist.adjust_song(0.25)
+        audio_player_with_playlist.adjust_song(0.5)
+        audio_player_with_playlist.adjust_song(1.0)
+        mock_set_pos.assert_called_once_with(45.0)
+
+        # The frame loop closes the window and applies the newest seek
+        mock_ticks.return_value = 5020
+        audio_player_with_playlist.flush_pending_seek()
+
+        assert mock_set_pos.call_count == 2
+        mock_set_pos.assert_called_with(180.0)
+        assert audio_player_with_playlist.seek_offset == 180.0
+
 
 class TestPlaylistNavigation:
     """Test playlist navigation logic."""
-    
-    @patch('audio.pygame.mixer.music.load')
-    @patch('audio.pygame.mixer.music.play')
-    @patch('audio.pygame.time.get_ticks')
-    def test_next_song_advances_index(self, mock_ticks, mock_play, mock_load, audio_player_with_playlist):
+
+    @pytest.fixture(autouse=True)
+    def mocks(self):
+        """Patch the mixer calls and clock once, yielding mocks by name."""
+        with patch.multiple('audio.pygame.mixer.music',
+                            load=DEFAULT, play=DEFAULT) as music_mocks, \
+                patch('audio.pygame.time.get_ticks', return_value=1000):
+            yield music_mocks
+
+    def test_next_song_advances_index(self, mocks, audio_player_with_playlist):
         """Test next_song advances to next track."""
-        mock_ticks.return_value = 1000
         audio_player_with_playlist.index = 0
-        
+
         audio_player_with_playlist.next_song()
-        
+
         assert audio_player_with_playlist.index == 1
-        mock_load.assert_called_with("song2.mp3")
-    
-    @patch('audio.pygame.mixer.music.load')
-    @patch('audio.pygame.mixer.music.play')
-    @patch('audio.pygame.time.get_ticks')
-    def test_next_song_wraps_to_beginning(self, mock_ticks, mock_play, mock_load, audio_player_with_playlist):
+        mocks['load'].assert_called_with("song2.mp3")
+
+    def test_next_song_wraps_to_beginning(self, mocks, audio_player_with_playlist):
         """Test next_song wraps to first track at end."""
-        mock_ticks.return_value = 1000
         audio_player_with_playlist.index = 2  # Last song
-        
+
         audio_player_with_playlist.next_song()
-        
+
         assert audio_player_with_playlist.index == 0
-        mock_load.assert_called_with("song1.mp3")
-    
-    @patch('audio.pygame.mixer.music.load')
-    @patch('audio.pygame.mixer.music.play')
-    @patch('audio.pygame.time.get_ticks')
-    def test_previous_song_goes_back(self, mock_ticks, mock_play, mock_load, audio_player_with_playlist):
+        mocks['load'].assert_called_with("song1.mp3")
+
+    def test_previous_song_goes_back(self, mocks, audio_player_with_playlist):
         """Test previous_song goes to previous track."""
-        mock_ticks.return_value = 1000
         audio_player_with_playlist.index = 1
-        
+
         audio_player_with_playlist.previous_song()
-        
+
         assert audio_player_with_playlist.index == 0
-        mock_load.assert_called_with("song1.mp3")
-    
-    @patch('audio.pygame.mixer.music.load')
-    @patch('audio.pygame.mixer.music.play')
-    @patch('audio.pygame.time.get_ticks')
-    def test_previous_song_wraps_to_end(self, mock_ticks, mock_play, mock_load, audio_player_with_playlist):
+        mocks['load'].assert_called_with("song1.mp3")
+
+    def test_previous_song_wraps_to_end(self, mocks, audio_player_with_playlist):
         """Test previous_song wraps to last track at beginning."""
-        mock_ticks.return_value = 1000
         audio_player_with_playlist.index = 0  # First song
-        
+
         audio_player_with_playlist.previous_song()
-        
+
         assert audio_player_with_playlist.index == 2
-        mock_load.assert_called_with("song3.mp3")
-    
+        mocks['load'].assert_called_with("song3.mp3")
+
     def test_next_song_empty_playlist_does_nothing(self, audio_player):
         """Test next_song with empty playlist doesn't crash."""
         audio_player.next_song()
         assert audio_player.index == 0
-    
+
     def test_previous_song_empty_playlist_does_nothing(self, audio_player):
         """Test previous_song with empty playlist doesn't crash."""
         audio_player.previous_song()
@@ -251,31 +260,96 @@ class TestPlaylistNavigation:
 
 class TestTogglePlayPause:
     """Test play/pause toggle functionality."""
-    
+
+    @pytest.fixture(autouse=True)
+    def mocks(self):
+        """Patch the mixer calls and clock once, yielding mocks by name."""
+        with patch.multiple('audio.pygame.mixer.music',
+                            load=DEFAULT, play=DEFAULT, pause=DEFAULT) as music_mocks, \
+                patch('audio.pygame.time.get_ticks', return_value=1000):
+            yield music_mocks
+
     def test_toggle_play_pause_empty_playlist_does_nothing(self, audio_player):
         """Test toggle with empty playlist doesn't crash."""
         audio_player.toggle_play_pause()
         assert audio_player.is_playing is False
-    
-    @patch('audio.pygame.mixer.music.load')
-    @patch('audio.pygame.mixer.music.play')
-    @patch('audio.pygame.time.get_ticks')
-    def test_toggle_play_pause_starts_playback(self, mock_ticks, mock_play, mock_load, audio_player_with_playlist):
+
+    def test_toggle_play_pause_starts_playback(self, mocks, audio_player_with_playlist):
         """Test toggle starts playback when stopped."""
-        mock_ticks.return_value = 1000
         audio_player_with_playlist.is_playing = False
-        
+
         audio_player_with_playlist.toggle_play_pause()
-        
+
         assert audio_player_with_playlist.is_playing is True
-        mock_load.assert_called_once()
-    
-    @patch('audio.pygame.mixer.music.pause')
-    def test_toggle_play_pause_pauses_playback(self, mock_pause, audio_player_with_playlist):
+        mocks['load'].assert_called_once()
+
+    def test_toggle_play_pause_pauses_playback(self, mocks, audio_player_with_playlist):
         """Test toggle pauses when playing."""
         audio_player_with_playlist.is_playing = True
-        
+
         audio_player_with_playlist.toggle_play_pause()
-        
+
         assert audio_player_with_playlist.is_playing is False
-        mock_pause.assert_called_once()
\ No newline at end of file
+        mocks['pause'].assert_called_once()
+
+class TestPlaylistIngest:
+    """Test the worker-to-frame-loop playlist handoff."""
+
+    @patch('audio.pygame.mixer.music.load')
+    @patch('audio.pygame.mixer.music.play')
+    @patch('audio.pygame.time.get_ticks')
+    def test_poll_ingest_installs_published_playlist(self, mock_ticks, mock_play, mock_load, audio_player):
+        """Test poll_ingest picks up the worker's playlist and starts playback."""
+        mock_ticks.return_value = 1000
+        audio_player.AUDIO_OK = True
+
+        audio_player._ingest_playlist(["song1.mp3", "song2.mp3"])
+        audio_player.poll_ingest()
+
+        assert audio_player.playlist == ["song1.mp3", "song2.mp3"]
+        assert audio_player.is_playing is True
+        mock_load.assert_called_once_with("song1.mp3")
+
+    def test_poll_ingest_without_pending_playlist_does_nothing(self, audio_player):
+        """Test poll_ingest is a no-op when no ingest has finished."""
+        audio_player.poll_ingest()
+
+        assert audio_player.playlist == []
+        assert audio_player.is_playing is False
+
+
+class TestFastMp3Length:
+    """Test the Xing-header duration fast path."""
+
+    @staticmethod
+    def _xing_frame(frames):
+        """Build a minimal MPEG1 Layer III frame carrying a Xing header."""
+        body = bytearray(417)
+        body[:4] = b"\xff\xfb\x90\x00"  # MPEG1 L3, 128 kbps, 44100 Hz, stereo
+        body[36:40] = b"Xing"
+        body[40:44] = (1).to_bytes(4, "big")  # flags: frame count present
+        body[44:48] = frames.to_bytes(4, "big")
+        return bytes(body)
+
+    def test_reads_duration_from_xing_header(self):
+        """Test duration comes straight from the Xing frame count."""
+        from audio import _fast_mp3_length
+
+        frames = 3827
+        length = _fast_mp3_length(io.BytesIO(self._xing_frame(frames)))
+
+        assert length is not None
+        assert abs(length - frames * 1152 / 44100) < 0.001
+
+    def test_returns_none_without_xing_header(self):
+        """Test plain CBR frames without Xing fall back to None."""
+        from audio import _fast_mp3_length
+
+        frame = b"\xff\xfb\x90\x00" + b"\x00" * 413
+        assert _fast_mp3_length(io.BytesIO(frame)) is None
+
+    def test_returns_none_for_garbage(self):
+        """Test non-MP3 data is rejected instead of crashing."""
+        from audio import _fast_mp3_length
+
+        assert _fast_mp3_length(io.BytesIO(b"not an mp3 at all")) is None
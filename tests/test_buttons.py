@@ -1,32 +1,16 @@
 """Unit tests for Buttons component."""
-import os
 import pytest
 import pygame
 
 
 from buttons import Buttons
-
-
-@pytest.fixture(scope="module", autouse=True)
-def setup_pygame():
-    """Initialize pygame once for all button tests."""
-    pygame.init()
-
-    # Create a display and # Create a dummy image for testing
-    pygame.display.set_mode((1, 1))  
-    
-    test_surface = pygame.Surface((50, 50))
-    pygame.image.save(test_surface, "test_button.png")
-    yield
-    pygame.quit()
-    if os.path.exists("test_button.png"):
-        os.remove("test_button.png")
+from tests._eventstub import mk_event
 
 
 @pytest.fixture
 def button():
     """Create a button instance for testing."""
-    return Buttons(100, 100, "test_button.png")
+    return Buttons(100, 100, pygame.Surface((50, 50)))
 
 
 class TestButtonInitialization:
@@ -54,10 +38,7 @@ class TestButtonPressState:
     
     def test_mouse_down_sets_is_down(self, button):
         """Test mouse down on button sets is_down to True."""
-        event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN,
-            {'pos': (100, 100)}
-        )
+        event = mk_event(pygame.MOUSEBUTTONDOWN, pos=(100, 100))
         
         button.handle_overlay(event)
         assert button.is_down is True
@@ -66,20 +47,14 @@ class TestButtonPressState:
         """Test mouse up clears is_down state."""
         button.is_down = True
         
-        event = pygame.event.Event(
-            pygame.MOUSEBUTTONUP,
-            {'pos': (100, 100)}
-        )
+        event = mk_event(pygame.MOUSEBUTTONUP, pos=(100, 100))
         
         button.handle_overlay(event)
         assert button.is_down is False
     
     def test_mouse_down_outside_does_not_set_is_down(self, button):
         """Test mouse down outside button doesn't set is_down."""
-        event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN,
-            {'pos': (500, 500)}
-        )
+        event = mk_event(pygame.MOUSEBUTTONDOWN, pos=(500, 500))
         
         button.handle_overlay(event)
         assert button.is_down is False
@@ -88,10 +63,7 @@ class TestButtonPressState:
         """Test mouse up clears is_down regardless of position."""
         button.is_down = True
         
-        event = pygame.event.Event(
-            pygame.MOUSEBUTTONUP,
-            {'pos': (500, 500)}
-        )
+        event = mk_event(pygame.MOUSEBUTTONUP, pos=(500, 500))
         
         button.handle_overlay(event)
         assert button.is_down is False
@@ -102,43 +74,28 @@ class TestButtonClickDetection:
     
     def test_was_clicked_returns_true_on_release_inside(self, button):
         """Test was_clicked returns True when released inside."""
-        event = pygame.event.Event(
-            pygame.MOUSEBUTTONUP,
-            {'pos': (100, 100)}
-        )
+        event = mk_event(pygame.MOUSEBUTTONUP, pos=(100, 100))
         
         result = button.was_clicked(event)
         assert result is True
     
     def test_was_clicked_returns_false_on_release_outside(self, button):
         """Test was_clicked returns False when released outside."""
-        event = pygame.event.Event(
-            pygame.MOUSEBUTTONUP,
-            {'pos': (500, 500)}
-        )
+        event = mk_event(pygame.MOUSEBUTTONUP, pos=(500, 500))
         
         result = button.was_clicked(event)
         assert result is False
     
     def test_was_clicked_returns_false_on_other_events(self, button):
         """Test was_clicked returns False for non-MOUSEBUTTONUP events."""
-        event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN,
-            {'pos': (100, 100)}
-        )
+        event = mk_event(pygame.MOUSEBUTTONDOWN, pos=(100, 100))
         
         result = button.was_clicked(event)
         assert result is False
     
-    def test_was_clicked_on_button_edge(self, button):
-        """Test click detection at button edges."""
-        # Get button boundaries
-        left = button.rect.left
-        right = button.rect.right
-        top = button.rect.top
-        bottom = button.rect.bottom
-        
-        # Test corners
-        for pos in [(left, top), (right-1, top), (left, bottom-1), (right-1, bottom-1)]:
-            event = pygame.event.Event(pygame.MOUSEBUTTONUP, {'pos': pos})
-            assert button.was_clicked(event) is True
\ No newline at end of file
+    # Corners of a 50x50 button centered at (100, 100)
+    @pytest.mark.parametrize("pos", [(75, 75), (124, 75), (75, 124), (124, 124)])
+    def test_was_clicked_on_button_edge(self, button, pos):
+        """Test click detection at button corners."""
+        event = mk_event(pygame.MOUSEBUTTONUP, pos=pos)
+        assert button.was_clicked(event) is True
\ No newline at end of file
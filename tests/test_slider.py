@@ -4,14 +4,7 @@ import pytest
 import pygame
 
 from slider import Slider_UI
-
-
-@pytest.fixture(autouse=True)
-def setup_pygame():
-    """Initialize pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
+from tests._eventstub import mk_event
 
 
 @pytest.fixture
@@ -80,10 +73,7 @@ class TestSliderEventHandling:
     
     def test_handle_event_mouse_down_starts_dragging(self, slider):
         """Test mouse down on slider starts dragging."""
-        event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN,
-            {'button': 1, 'pos': (50, 5)}
-        )
+        event = mk_event(pygame.MOUSEBUTTONDOWN, button=1, pos=(50, 5))
         
         slider.handle_event(event)
         assert slider.dragging is True
@@ -92,30 +82,21 @@ class TestSliderEventHandling:
         """Test mouse up stops dragging."""
         slider.dragging = True
         
-        event = pygame.event.Event(
-            pygame.MOUSEBUTTONUP,
-            {'button': 1, 'pos': (50, 5)}
-        )
+        event = mk_event(pygame.MOUSEBUTTONUP, button=1, pos=(50, 5))
         
         slider.handle_event(event)
         assert slider.dragging is False
     
     def test_handle_event_mouse_down_outside_does_nothing(self, slider):
         """Test mouse down outside slider doesn't start dragging."""
-        event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN,
-            {'button': 1, 'pos': (200, 200)}
-        )
+        event = mk_event(pygame.MOUSEBUTTONDOWN, button=1, pos=(200, 200))
         
         slider.handle_event(event)
         assert slider.dragging is False
     
     def test_handle_event_right_click_ignored(self, slider):
         """Test right mouse button is ignored."""
-        event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN,
-            {'button': 3, 'pos': (50, 5)}
-        )
+        event = mk_event(pygame.MOUSEBUTTONDOWN, button=3, pos=(50, 5))
         
         slider.handle_event(event)
         assert slider.dragging is False
@@ -124,10 +105,7 @@ class TestSliderEventHandling:
         """Test mouse motion updates value while dragging."""
         slider.dragging = True
         
-        event = pygame.event.Event(
-            pygame.MOUSEMOTION,
-            {'pos': (80, 5)}
-        )
+        event = mk_event(pygame.MOUSEMOTION, pos=(80, 5))
         
         slider.handle_event(event)
         assert 0.79 < slider.value < 0.81